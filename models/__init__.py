@@ -1,4 +1,7 @@
 
+from . import account_move
+from . import ir_attachment
+from . import product_product
 from . import sale_order
 from . import res_partner
 from . import stock_quant
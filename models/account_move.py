@@ -0,0 +1,33 @@
+from odoo import fields, models
+
+
+class AccountMove(models.Model):
+    _inherit = "account.move"
+
+    # Direct link to the stamped CFDI XML so /download_invoice resolves it
+    # with one foreign-key read instead of a three-condition attachment
+    # search. The XML is immutable once the invoice is stamped, so the link
+    # never goes stale. Stamping happens in l10n_mx_edi core code; rows
+    # without the link fall back to the indexed attachment search.
+    l10n_mx_edi_xml_attachment_id = fields.Many2one(
+        "ir.attachment",
+        string="CFDI XML Attachment",
+        index=True,
+        copy=False,
+    )
+
+    def init(self):
+        """Create a partial index backing the credit-note fallback lookup.
+
+        /create_credit_note falls back to searching moves by
+        reversed_entry_id; reversals are a small fraction of account_move,
+        so a partial index keeps the probe tiny.
+        """
+        super().init()
+        self.env.cr.execute(
+            """
+            CREATE INDEX IF NOT EXISTS account_move_reversed_entry_idx
+            ON account_move (reversed_entry_id)
+            WHERE reversed_entry_id IS NOT NULL
+            """
+        )
@@ -0,0 +1,21 @@
+from odoo import models
+
+
+class IrAttachment(models.Model):
+    _inherit = "ir.attachment"
+
+    def init(self):
+        """Create a partial index backing the invoice XML lookup.
+
+        The /download_invoice endpoint searches attachments by res_id with
+        res_model/mimetype fixed; the partial index keeps only the stamped
+        CFDI rows so the search resolves with a small index probe.
+        """
+        super().init()
+        self.env.cr.execute(
+            """
+            CREATE INDEX IF NOT EXISTS ir_attachment_invoice_xml_idx
+            ON ir_attachment (res_id, id DESC)
+            WHERE res_model = 'account.move' AND mimetype = 'application/xml'
+            """
+        )
@@ -0,0 +1,47 @@
+from odoo import models, api
+from odoo.tools import ormcache
+
+
+class ProductProduct(models.Model):
+    _inherit = "product.product"
+
+    @api.model
+    @ormcache("company_id", "sku")
+    def _resolve_id_by_sku(self, company_id, sku):
+        """Return the id of the product with the given internal reference.
+
+        SKUs are stable and the lookup is hot from integrations, so the
+        result is memoized in the registry cache; it is flushed whenever a
+        product's internal reference changes.
+
+        Args:
+            company_id (int): Company used to scope the search.
+            sku (str): The internal reference (default_code) of the product.
+
+        Returns:
+            int | bool: The product id, or False when no product matches.
+        """
+        product = self.with_company(company_id).search(
+            [("default_code", "=", sku)], limit=1, order="id"
+        )
+        return product.id
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        products = super().create(vals_list)
+        if any(vals.get("default_code") for vals in vals_list):
+            self.env.registry.clear_cache()
+        return products
+
+    def write(self, vals):
+        result = super().write(vals)
+        if "default_code" in vals or "active" in vals:
+            self.env.registry.clear_cache()
+        return result
+
+    def unlink(self):
+        had_sku = any(product.default_code for product in self)
+        result = super().unlink()
+        if had_sku:
+            self.env.registry.clear_cache()
+        return result
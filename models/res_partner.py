@@ -1,12 +1,83 @@
-from odoo import models, api
+from odoo import fields, models, api
+from odoo.osv import expression
+import logging
+import re
+
+logger = logging.getLogger(__name__)
+
+# Root-level request keys copied into the contact values when creating
+_CONTACT_FIELDS = ("name", "email", "phone", "mobile")
+
+
+def _phone_suffix(number):
+    """Return the last 10 digits of a phone number, ignoring formatting."""
+    return re.sub(r"\D", "", number or "")[-10:]
 
 
 class ResPartner(models.Model):
     _inherit = "res.partner"
 
+    # Index the columns used by search_contacts_by_params so the API lookups
+    # hit an index instead of scanning res_partner. btree_not_null keeps the
+    # phone index small since most partners have no sanitized phone.
+    email = fields.Char(index=True)
+    phone_sanitized = fields.Char(index="btree_not_null")
+
+    # Stored fragment of the sanitized phone so the loose "last 10 digits"
+    # match is an indexed equality instead of a leading-wildcard LIKE
+    phone_suffix10 = fields.Char(
+        compute="_compute_phone_suffix10",
+        store=True,
+        index="btree_not_null",
+    )
+
+    @api.depends("phone_sanitized")
+    def _compute_phone_suffix10(self):
+        for partner in self:
+            partner.phone_suffix10 = _phone_suffix(partner.phone_sanitized) or False
+
+    def init(self):
+        """Create the custom indexes behind the contact API lookups.
+
+        A partial (parent_id, type) index covers the address probe in
+        /create_address while only holding address children, not every
+        contact.
+
+        create_or_find_contact searches with a leading-wildcard =ilike, which
+        a b-tree index cannot serve. A pg_trgm GIN index lets PostgreSQL
+        answer it without a full res_partner scan. Skipped with a warning if
+        the extension cannot be installed (requires superuser).
+        """
+        super().init()
+        cr = self.env.cr
+        cr.execute(
+            """
+            CREATE INDEX IF NOT EXISTS res_partner_parent_type_addr_idx
+            ON res_partner (parent_id, type)
+            WHERE type IN ('invoice', 'delivery')
+            """
+        )
+        cr.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        if not cr.fetchone():
+            try:
+                with cr.savepoint():
+                    cr.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+            except Exception:
+                logger.warning(
+                    "Could not install pg_trgm; store name lookups will not "
+                    "use a trigram index."
+                )
+                return
+        cr.execute(
+            """
+            CREATE INDEX IF NOT EXISTS res_partner_name_trgm_idx
+            ON res_partner USING gin (name gin_trgm_ops)
+            """
+        )
+
     @api.model
-    def search_contacts_by_params(self, search_params):
-        """Search for contacts based on given parameters.
+    def _contact_search_domain(self, search_params):
+        """Build the domain used to match a contact from API parameters.
 
         Args:
             search_params (dict): A dictionary of search parameters.
@@ -17,7 +88,7 @@ class ResPartner(models.Model):
                 - strict_phone (bool): Whether to perform strict phone matching.
 
         Returns:
-            recordset: A recordset of matching partners.
+            list: A search domain, empty when no identifying field was given.
         """
         email = search_params.get("email")
         phone = search_params.get("phone")
@@ -33,18 +104,36 @@ class ResPartner(models.Model):
         if name:
             domain.append(("name", "ilike", name.strip()))
 
-        # Logic for phone and mobile
-        operator = "=" if strict_phone else "ilike"
+        # Logic for phone and mobile. The loose match compares the last 10
+        # digits through the stored phone_suffix10 column, so both paths are
+        # indexed equality lookups.
+        def phone_leaf(number):
+            if strict_phone:
+                return ("phone_sanitized", "=", number.strip())
+            return ("phone_suffix10", "=", _phone_suffix(number))
 
         if phone and mobile:
             domain.append("|")
-            domain.append(("phone_sanitized", operator, phone.strip()))
-            domain.append(("phone_sanitized", operator, mobile.strip()))
+            domain.append(phone_leaf(phone))
+            domain.append(phone_leaf(mobile))
         elif phone:
-            domain.append(("phone_sanitized", operator, phone.strip()))
+            domain.append(phone_leaf(phone))
         elif mobile:
-            domain.append(("phone_sanitized", operator, mobile.strip()))
+            domain.append(phone_leaf(mobile))
+
+        return domain
 
+    @api.model
+    def search_contacts_by_params(self, search_params):
+        """Search for contacts based on given parameters.
+
+        Args:
+            search_params (dict): Search parameters, see _contact_search_domain.
+
+        Returns:
+            recordset: A recordset of matching partners.
+        """
+        domain = self._contact_search_domain(search_params)
         if domain:
             return self.search(domain)
         else:
@@ -64,18 +153,35 @@ class ResPartner(models.Model):
 
         self_with_company = self.with_company(company_id)
 
-        # Search existing contact using strict or loose params
-        existing_contacts = self_with_company.search_contacts_by_params(data)
+        # Both lookups are collapsed into one OR-domain search; the
+        # params-over-store precedence is restored in memory with
+        # filtered_domain, so the database is hit once either way.
+        params_domain = self._contact_search_domain(data)
+        store_name = data.get("store_name")
+        store_domain = [("name", "=ilike", f"%{store_name}")] if store_name else []
+
+        existing_contacts = self_with_company.browse()
+        parent_contact = self_with_company.browse()
+        if params_domain and store_domain:
+            # Fetch only the columns filtered_domain needs to classify the
+            # matches, not the whole partner row per hit
+            matches = self_with_company.search_fetch(
+                expression.OR([params_domain, store_domain]),
+                ["email", "name", "phone_sanitized", "phone_suffix10"],
+            )
+            existing_contacts = matches.filtered_domain(params_domain)
+            parent_contact = (matches - existing_contacts)[:1]
+        elif params_domain:
+            existing_contacts = self_with_company.search(params_domain)
+        elif store_domain:
+            parent_contact = self_with_company.search(store_domain, limit=1)
+
         if existing_contacts:
             # Return the last found (as per original controller logic) and False for is_new
             return existing_contacts[-1], False
 
         # Logic for Store Name (specific business rule)
-        store_name = data.get("store_name")
         if store_name:
-            store_domain = [("name", "=ilike", f"%{store_name}")]
-            parent_contact = self_with_company.search(store_domain, limit=1)
-
             if parent_contact:
                 return parent_contact, False
 
@@ -90,16 +196,129 @@ class ResPartner(models.Model):
                     }
                 )
 
-        contact_vals = data.get("contact_data", {})
+        # Root-level fields are fallbacks: contact_data values win the merge
+        contact_vals = {
+            **{f: data[f] for f in _CONTACT_FIELDS if data.get(f)},
+            **data.get("contact_data", {}),
+            "company_id": company_id,
+        }
 
-        # Extract allowed fields from root to contact_vals if not present
-        for field in ("name", "email", "phone", "mobile"):
-            val = data.get(field)
-            if val:
-                contact_vals.setdefault(field, val)
+        # Create new contact. The API only consumes the id, so skip the
+        # computed-field prefetch and the chatter log/subscription writes.
+        new_contact = self_with_company.with_context(
+            prefetch_fields=False,
+            tracking_disable=True,
+            mail_create_nolog=True,
+            mail_notrack=True,
+        ).create(contact_vals)
+        return new_contact, True
 
-        contact_vals["company_id"] = company_id
+    @api.model
+    def create_contacts_batch(self, entries):
+        """Create several contacts at once, reusing existing matches.
 
-        # Create new contact
-        new_contact = self_with_company.create(contact_vals)
-        return new_contact, True
+        Duplicates are resolved with a single search over every email and
+        phone suffix in the batch, and the remaining contacts go through one
+        multi-create call, so the per-record ORM overhead of
+        create_or_find_contact is paid once per batch.
+
+        Args:
+            entries (list of dict): Contact payloads with the same keys as
+                create_or_find_contact (email, phone, mobile, name,
+                contact_data).
+
+        Returns:
+            tuple: (list of per-entry results aligned with entries,
+            number of contacts created)
+        """
+        emails = {e["email"].strip().lower() for e in entries if e.get("email")}
+        suffixes = {
+            _phone_suffix(e.get("phone") or e.get("mobile"))
+            for e in entries
+            if e.get("phone") or e.get("mobile")
+        }
+
+        # Emails match case-insensitively (=ilike on the whole value), so a
+        # contact stored with different casing still counts as a duplicate;
+        # the lowercased dict keys below narrow any wildcard over-match
+        domains = [[("email", "=ilike", email)] for email in emails]
+        if suffixes:
+            domains.append([("phone_suffix10", "in", list(suffixes))])
+
+        by_email = {}
+        by_suffix = {}
+        if domains:
+            existing = self.search_read(
+                expression.OR(domains), ["email", "phone_suffix10"]
+            )
+            for contact in existing:
+                if contact["email"]:
+                    by_email.setdefault(contact["email"].lower(), contact["id"])
+                if contact["phone_suffix10"]:
+                    by_suffix.setdefault(contact["phone_suffix10"], contact["id"])
+
+        results = []
+        to_create = []
+        # Entries repeating a key already queued for creation resolve to
+        # that entry's contact instead of creating a duplicate
+        new_by_email = {}
+        new_by_suffix = {}
+        duplicate_of = {}
+        for index, entry in enumerate(entries):
+            email = (entry.get("email") or "").strip().lower()
+            suffix = _phone_suffix(entry.get("phone") or entry.get("mobile"))
+            existing_id = (email and by_email.get(email)) or (
+                suffix and by_suffix.get(suffix)
+            )
+            if existing_id:
+                results.append(
+                    {"index": index, "contact_id": existing_id, "is_new": False}
+                )
+                continue
+
+            vals = {
+                **{f: entry[f] for f in _CONTACT_FIELDS if entry.get(f)},
+                **entry.get("contact_data", {}),
+                "company_id": self.env.company.id,
+            }
+            if not vals.get("name") and not vals.get("email"):
+                results.append({"index": index, "error": "name or email is required"})
+                continue
+
+            position = new_by_email.get(email) if email else None
+            if position is None and suffix:
+                position = new_by_suffix.get(suffix)
+            if position is not None:
+                duplicate_of[index] = position
+                continue
+
+            position = len(to_create)
+            to_create.append((index, vals))
+            if email:
+                new_by_email[email] = position
+            if suffix:
+                new_by_suffix[suffix] = position
+
+        new_contacts = self.browse()
+        if to_create:
+            new_contacts = self.with_context(
+                prefetch_fields=False,
+                tracking_disable=True,
+                mail_create_nolog=True,
+                mail_notrack=True,
+            ).create([vals for _, vals in to_create])
+            for (index, _), contact in zip(to_create, new_contacts):
+                results.append(
+                    {"index": index, "contact_id": contact.id, "is_new": True}
+                )
+            for index, position in duplicate_of.items():
+                results.append(
+                    {
+                        "index": index,
+                        "contact_id": new_contacts[position].id,
+                        "is_new": False,
+                    }
+                )
+
+        results.sort(key=lambda result: result["index"])
+        return results, len(new_contacts)
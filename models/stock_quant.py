@@ -4,12 +4,14 @@ from odoo import models
 class StockQuant(models.Model):
     _inherit = "stock.quant"
 
-    def get_stock_by_location(self, location_id, sku=None):
+    def get_stock_by_location(self, location_id, sku=None, skus=None):
         """Get stock information for products at a specific location.
 
         Args:
             location_id (int): Stock location ID
             sku (str, optional): Product SKU. If provided, returns only that product.
+            skus (list of str, optional): Several product SKUs. If provided,
+                returns the stock of all of them in a single response.
 
         Returns:
             dict: Stock information for product(s) at the location
@@ -17,7 +19,13 @@ class StockQuant(models.Model):
         # Build domain
         domain = [("location_id", "=", location_id)]
         product = None
-        
+
+        if skus:
+            domain.append(("product_id.default_code", "in", skus))
+            quants = self.search(domain)
+            self._warm_quant_cache(quants)
+            return self._build_skus_response(quants, skus, location_id)
+
         if sku:
             product = self.env["product.product"].search(
                 [("default_code", "=", sku)], limit=1
@@ -33,6 +41,7 @@ class StockQuant(models.Model):
 
         # Get quants
         quants = self.search(domain)
+        self._warm_quant_cache(quants)
 
         # Single product mode
         if sku:
@@ -41,6 +50,18 @@ class StockQuant(models.Model):
         # All products mode
         return self._build_all_products_response(quants, location_id)
 
+    def _warm_quant_cache(self, quants):
+        """Warm the quant columns and related names in batched reads.
+
+        The response builders dereference product, lot and package data per
+        quant; reading everything up front keeps those accesses on the cache
+        instead of issuing lazy fetches inside the loops.
+        """
+        quants.read(["product_id", "lot_id", "package_id", "quantity", "reserved_quantity"])
+        quants.product_id.read(["name", "default_code"])
+        quants.lot_id.read(["name"])
+        quants.package_id.read(["name"])
+
     def _build_single_product_response(self, quants, product, location_id):
         """Build response for single product query."""
         location = self.env["stock.location"].browse(location_id)
@@ -57,6 +78,40 @@ class StockQuant(models.Model):
             "stock_details": [self._build_quant_detail(q) for q in quants],
         }
 
+    def _build_skus_response(self, quants, skus, location_id):
+        """Build response for a batched SKU query, keyed by SKU."""
+        location = self.env["stock.location"].browse(location_id)
+        stock_by_sku = {}
+
+        for quant in quants:
+            sku = quant.product_id.default_code
+            entry = stock_by_sku.setdefault(
+                sku,
+                {
+                    "product_id": quant.product_id.id,
+                    "product_name": quant.product_id.name,
+                    "sku": sku,
+                    "on_hand_qty": 0,
+                    "reserved_qty": 0,
+                    "available_qty": 0,
+                    "stock_details": [],
+                },
+            )
+            entry["on_hand_qty"] += quant.quantity
+            entry["reserved_qty"] += quant.reserved_quantity
+            entry["available_qty"] += quant.quantity - quant.reserved_quantity
+            entry["stock_details"].append(self._build_quant_detail(quant))
+
+        return {
+            "message": (
+                f"Stock information retrieved for {len(stock_by_sku)} "
+                f"of {len(skus)} requested SKUs"
+            ),
+            "location_id": location.id,
+            "location_name": location.complete_name,
+            "products_by_sku": stock_by_sku,
+        }
+
     def _build_all_products_response(self, quants, location_id):
         """Build response for all products query."""
         location = self.env["stock.location"].browse(location_id)